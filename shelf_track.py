@@ -1,373 +1,467 @@
-import sqlite3
-
-
-# ************************** DATABASE SETUP **************************#
-
-# Function to create a connection
-def get_database_connection(db_name="ebookstore.db"):
-    """
-    Create database connection and return to the SQLite database.
-    """
-    db = sqlite3.connect(db_name)
-    return db
-
-
-# Function to create book and author tables
-def create_tables(db):
-    """
-    Create the book and author tables if it does not exist.
-    """
-    # Open a connection to the database
-    with get_database_connection() as db:
-        cursor = db.cursor()  # create a cursor
-
-        # Create 'author' table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS author (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                country TEXT NOT NULL
-            )
-        ''')
-        db.commit()
-
-        # Create 'book' table with authorID as foreign key
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS book(
-                id INTEGER PRIMARY KEY,
-                title TEXT NOT NULL,
-                authorID INTEGER NOT NULL,
-                qty INTEGER NOT NULL,
-                FOREIGN KEY (authorID) REFERENCES author(id)
-            )
-        ''')
-        db.commit()
-
-
-# Function to populate book and author table
-def populate_tables(db):
-    """
-    Insert initial the initial records into book and author tables.
-    """
-
-    # Open a connection to the database
-    with get_database_connection():
-        cursor = db.cursor()  # create a cursor
-
-        # initail records for book table
-        initial_books = [
-            (3001, "A Tale of Two Cities", 1290, 30),
-            (3002, "Harry Potter and the Philosopher's Stone", 8937, 40),
-            (3003, "The Lion, the Witch and the Wardrobe", 2356, 25),
-            (3004, "The Lord of the Rings", 6380, 37),
-            (3005, "Alice’s Adventures in Wonderland", 5620, 12)
-        ]
-
-        # initial records for author table
-        initial_authors = [
-            (1290, "Charles Dickens", "England"),
-            (8937, "J.K. Rowling", "England"),
-            (2356, "C.S. Lewis", "Ireland"),
-            (6380, "J.R.R. Tolkien", "South Africa"),
-            (5620, "Lewis Carroll", "England"),
-        ]
-
-        # Insert all initial records into 'book' table
-        cursor.executemany('''
-            INSERT OR IGNORE INTO book (id, title, authorID, qty)
-            VALUES (?, ?, ?, ?)
-        ''', initial_books)
-
-        # Insert all initial records into 'author' table
-        cursor.executemany('''
-            INSERT OR IGNORE INTO author (id, name, country)
-            VALUES (?, ?, ?)
-        ''', initial_authors)
-        db.commit()
-
-
-# ************************** VALIDATION FUNCTIONS **************************
-
-# Function to validate the length of the Book Id
-def get_valid_integer(prompt, length=4):
-    """
-    Prompt user for a valid integer with optional length check
-    """
-    while True:
-        try:
-            # Prompt the user
-            value = input(prompt).strip()
-            # Check if user input is the correct
-            if not value.isdigit():
-                raise ValueError("Input must be a number.")
-
-            # Check if the input has the correct length
-            if length and len(value) != length:
-                raise ValueError(f"Input must be {length} digits.")
-
-            # Return the input as an integer
-            return int(value)
-        except ValueError as v:
-            print(f"Invalid input: {v}")
-
-
-# ************************** CORE FUNCTIONALITY **************************
-
-# Function to add a book
-def enter_book(db):
-    """
-    Prompt user to enter details and insert them into book and author tables
-    """
-
-    # Open a connection to the database
-    with get_database_connection() as db:
-        cursor = db.cursor()  # create a cursor
-
-        # prompts user for book records
-        id = get_valid_integer("Enter book ID(4 digits): ")
-        title = input("Enter book title: ").strip()
-        authorID = get_valid_integer("Enter author ID(4 digits): ")
-        qty = int(input("Enter quantity: "))
-
-        # Checks if author already exists
-        cursor.execute('''
-                       SELECT * FROM author WHERE id = ?
-        ''', (authorID,))
-        if not cursor.fetchone():
-            print("Author not found. Please enter author details.")
-            name = input("Enter author's name: ").strip()
-            country = input("Enter author's country: ").strip()
-
-            # Insert all new records into author table
-            cursor.execute('''
-                INSERT OR IGNORE INTO author (id, name, country)
-                VALUES (?, ?, ?)
-            ''', (authorID, name, country))
-
-        # Insert all new records into book table
-        cursor.execute('''
-            INSERT OR IGNORE INTO book(id, title, authorID, qty)
-            VALUES(?, ?, ?, ?)
-        ''', (id, title, authorID, qty))
-        db.commit()
-        print("Book added to book database")
-
-
-# Function to update a book
-def update_book(db):
-    """
-    Update an existing book or author details
-    """
-
-    # Open a connection to the database
-    with get_database_connection() as db:
-        cursor = db.cursor()  # create a cursor
-
-        # Prompt user for a valid 4-digit book ID
-        id = get_valid_integer("Enter 4-digit book ID to update: ")
-
-        #  Fetch the book and author information using INNER JOIN
-        cursor.execute('''
-            SELECT b.id, b.title, a.name, a.country
-            FROM book b
-            JOIN author a ON b.authorID = a.id
-            WHERE b.id = ?
-        ''', (id,))
-        record = cursor.fetchone()  # Get the first matching record
-
-        # If no record is found, notify the user and return
-        if not record:
-            print("Book not found.")
-            return
-        else:
-            # Display current book and author details
-            print("\nCurrent details:")
-            print(f"Title: {record[1]}")
-            print(f"Author: {record[2]}")
-            print(f"Country: {record[3]}")
-
-            # Display the available update options
-            print("\nUpdate options:")
-            print("1. Update quantity (default)")
-            print("2. Update title")
-            print("3. Update name")
-            print("4. Update author country")
-            choice = input("Select an option: ").strip()
-
-            # Based on user's choice, perform appropriate update
-            if choice == '1':
-                # Update quantity in book table
-                new_qty = get_valid_integer("Enter new quantity: ")
-                cursor.execute('''
-                    UPDATE book SET qty = ? WHERE id = ?,
-                ''', (new_qty, id))
-
-            elif choice == '2':
-                # Update title in book table
-                new_title = input("Enter new title: ").strip()
-                cursor.execute('''
-                    UPDATE book SET title = ? WHERE id = ?,
-                ''', (new_title, id))
-
-            elif choice == '3':
-                # Update author name in author table
-                new_name = input("Enter new name: ").strip()
-                cursor.execute('''
-                    UPDATE book SET authorID = ? WHERE id = ?,
-                 ''', (new_name, record[0]))
-
-            elif choice == '4':
-                # Update author's country in author table
-                new_country = input("Enter new author country: ").strip()
-                cursor.execute('''
-                    UPDATE author SET country = ? WHERE id = ?,
-                ''', (new_country, record[0]))
-
-            else:
-                # If invalid choice is given, print message and exit
-                print("Invalid choice.")
-                return
-
-            db.commit()
-            print("Book updated successfully!")
-
-
-# =============== Function to delete a book ===============
-def delete_book(db):
-    """
-    Delete a book from the database by the ID.
-    """
-
-    # Open a connection to the database
-    with get_database_connection() as db:
-        cursor = db.cursor()  # create a cursor
-
-        # Prompt the user to enter a 4-digit book ID
-        id = get_valid_integer("Enter 4-digit book ID to deete: ")
-
-        # Delete the book with the given ID
-        cursor.execute('''
-            DELETE FROM book WHERE id = ?
-        ''', (id,))
-
-        # Check if any rows were deleted
-        if cursor.rowcount == 0:
-            print("No book found with that ID.")
-        else:
-            # If deletion was successful commit the change
-            db.commit()
-            print("Book deleted successfully.")
-
-
-# =============== Function to search for a book ===============
-def search_book(db):
-    """
-    Search for a specific book by title or ID.
-    """
-
-    # Open a connection to the database
-    with get_database_connection() as db:
-        cursor = db.cursor()  # create a cursor
-
-        # Prompt user to choose search method
-        print("\nSearch options:")
-        print("1. Search by ID")
-        print("2. Search by title")
-        choice = input("Select an option: ").strip()
-
-        # If the user wants to search by book ID
-        if choice == '1':
-            id = get_valid_integer("Enter book ID: ")  # Validate book ID
-            cursor.execute('''
-                SELECT * FROM book WHERE id = ?
-            '''), (id,)
-
-        # If the user wants to search by title
-        elif choice == '2':
-            title = input("Enter book title: ").strip()
-            cursor.execute('''
-                SELECT * FROM book WHERE title LIKE ?
-            '''), ('%' + title + '%',)
-
-        # Handle invalid choices
-        else:
-            print("Invalid choice.")
-            return
-
-        # Fetch all matching results from the query
-        book_search = cursor.fetchall()
-        # If any books were found, print their details
-        if book_search:
-            print("\nFound books:")
-            for book in book_search:
-                print(f"ID: {book[0]}, Title: {book[1]}, "
-                      f"AuthorID: {book[2]}, Quantity: {book[3]}")
-        else:
-            print("No matching books found.")
-
-
-# =============== Function to view all book details ===============
-def view_book_details(db):
-    """
-    Display a list of books with the author's name and country
-    """
-
-    with get_database_connection() as db:
-        cursor = db.cursor()  # create a cursor
-
-        # Join 'book' and 'author' tables
-        cursor.execute('''
-            SELECT b.title, a.name, a.country
-            FROM book b
-            INNER JOIN author a ON b.authorID = a.id
-        ''')
-        # Fetch matching records from the executed query
-        rows = cursor.fetchall()
-
-        # Check if any results were found
-        if rows:
-            # Loop through results and display
-            print("\nDetails")
-            for title, name, country in rows:
-                print("-" * 50)
-                print(f"Title: {title}")
-                print(f"Author's Name: {name}")
-                print(f"Author's Country: {country}")
-                print("-" * 50)
-            else:
-                print("No books to display.")
-
-
-# =================== Main Program ===================
-
-# Initialize the database and set up tables
-db = get_database_connection()
-create_tables(db)
-populate_tables(db)
-
-# Main user options
-while True:
-    print("\nMenu:")
-    print("1. Enter book")
-    print("2. Update book")
-    print("3. Delete book")
-    print("4. Search books")
-    print("5. View details of all books")
-    print("0. Exit")
-    choice = input("Enter your choice: ").strip()
-
-    if choice == '1':
-        enter_book(db)
-    elif choice == '2':
-        update_book(db)
-    elif choice == '3':
-        delete_book(db)
-    elif choice == '4':
-        search_book(db)
-    elif choice == '5':
-        view_book_details(db)
-    elif choice == '0':
-        print("Goodbye!")
-        break
-    else:
-        print("Invalid choice. Please try again.")
+import atexit
+import re
+import sqlite3
+import sys
+from functools import lru_cache
+from itertools import chain
+
+
+# ************************** DATABASE SETUP **************************#
+
+# Function to create a connection
+def get_database_connection(db_name="ebookstore.db"):
+    """
+    Create database connection and return to the SQLite database.
+
+    The connection is opened once and shared by every function so the
+    SQLite page cache stays warm between operations.
+    """
+    # A larger statement cache keeps every hot query prepared, so the
+    # SQL text is only parsed the first time it runs
+    db = sqlite3.connect(db_name, cached_statements=256)
+    # Tune the connection once, up front, so every later query benefits
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA cache_size=-20000")
+    # Make sure the connection is closed cleanly when the program exits
+    atexit.register(db.close)
+    return db
+
+
+# Function to create book and author tables
+def create_tables(db):
+    """
+    Create the book and author tables if it does not exist.
+    """
+    cursor = db.cursor()  # create a cursor
+
+    # Create 'author' table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS author (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            country TEXT NOT NULL
+        )
+    ''')
+    db.commit()
+
+    # Create 'book' table with authorID as foreign key
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS book(
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            authorID INTEGER NOT NULL,
+            qty INTEGER NOT NULL,
+            FOREIGN KEY (authorID) REFERENCES author(id)
+        )
+    ''')
+    db.commit()
+
+    # Index the foreign key so the book/author JOINs do not fall back
+    # to a full table scan
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_book_authorID ON book(authorID)
+    ''')
+
+    # Index titles for case-insensitive lookups
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_book_title
+        ON book(title COLLATE NOCASE)
+    ''')
+
+    # Remember whether the full-text table already exists, so the
+    # rebuild below only runs the first time it is created
+    cursor.execute('''
+        SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'book_fts'
+    ''')
+    fts_existed = cursor.fetchone() is not None
+
+    # Full-text shadow table over book titles, so title searches use a
+    # tokenized index instead of scanning every row
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS book_fts
+        USING fts5(title, content='book', content_rowid='id')
+    ''')
+
+    # Triggers that keep book_fts in sync with the book table
+    cursor.executescript('''
+        CREATE TRIGGER IF NOT EXISTS book_fts_insert
+        AFTER INSERT ON book BEGIN
+            INSERT INTO book_fts (rowid, title)
+            VALUES (new.id, new.title);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS book_fts_delete
+        AFTER DELETE ON book BEGIN
+            INSERT INTO book_fts (book_fts, rowid, title)
+            VALUES ('delete', old.id, old.title);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS book_fts_update
+        AFTER UPDATE ON book BEGIN
+            INSERT INTO book_fts (book_fts, rowid, title)
+            VALUES ('delete', old.id, old.title);
+            INSERT INTO book_fts (rowid, title)
+            VALUES (new.id, new.title);
+        END;
+    ''')
+
+    if not fts_existed:
+        # One-off rebuild so books added before book_fts existed are
+        # searchable; afterwards the triggers keep the index in sync
+        cursor.execute("INSERT INTO book_fts (book_fts) VALUES ('rebuild')")
+    db.commit()
+
+
+# Maximum rows per multi-row INSERT, kept well under SQLite's
+# host-parameter limit (999 on older builds)
+_INSERT_CHUNK_SIZE = 200
+
+
+# Helper to insert many rows with one statement per chunk
+def bulk_insert(cursor, table, columns, rows):
+    """
+    Insert rows with a single multi-row INSERT per chunk of rows.
+
+    Builds 'INSERT OR IGNORE INTO table (cols) VALUES (...),(...),...'
+    so the statement is parsed once per chunk instead of once per row.
+    """
+    placeholder = "(" + ", ".join("?" * len(columns)) + ")"
+    for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+        chunk = rows[start:start + _INSERT_CHUNK_SIZE]
+        sql = (
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+            f"VALUES {', '.join([placeholder] * len(chunk))}"
+        )
+        cursor.execute(sql, list(chain.from_iterable(chunk)))
+
+
+# Function to populate book and author table
+def populate_tables(db):
+    """
+    Insert initial the initial records into book and author tables.
+    """
+    cursor = db.cursor()  # create a cursor
+
+    # initail records for book table
+    initial_books = [
+        (3001, "A Tale of Two Cities", 1290, 30),
+        (3002, "Harry Potter and the Philosopher's Stone", 8937, 40),
+        (3003, "The Lion, the Witch and the Wardrobe", 2356, 25),
+        (3004, "The Lord of the Rings", 6380, 37),
+        (3005, "Alice’s Adventures in Wonderland", 5620, 12)
+    ]
+
+    # initial records for author table
+    initial_authors = [
+        (1290, "Charles Dickens", "England"),
+        (8937, "J.K. Rowling", "England"),
+        (2356, "C.S. Lewis", "Ireland"),
+        (6380, "J.R.R. Tolkien", "South Africa"),
+        (5620, "Lewis Carroll", "England"),
+    ]
+
+    # Insert all initial records in one transaction, one statement per
+    # table, instead of one statement per row
+    cursor.execute("BEGIN")
+    bulk_insert(cursor, "book", ("id", "title", "authorID", "qty"),
+                initial_books)
+    bulk_insert(cursor, "author", ("id", "name", "country"),
+                initial_authors)
+    db.commit()
+
+
+# ************************** SQL STATEMENTS **************************
+
+# Hoisted to module level so every call reuses the exact same string,
+# making the connection's statement-cache lookup a pointer compare
+_SQL_FIND_AUTHOR = "SELECT 1 FROM author WHERE id = ? LIMIT 1"
+_SQL_INSERT_AUTHOR = (
+    "INSERT OR IGNORE INTO author (id, name, country) VALUES (?, ?, ?)"
+)
+_SQL_INSERT_BOOK = (
+    "INSERT OR IGNORE INTO book (id, title, authorID, qty) "
+    "VALUES (?, ?, ?, ?)"
+)
+_SQL_BOOK_WITH_AUTHOR = (
+    "SELECT b.id, b.title, a.name, a.country, a.id "
+    "FROM book b JOIN author a ON b.authorID = a.id WHERE b.id = ?"
+)
+_SQL_UPDATE_QTY = "UPDATE book SET qty = ? WHERE id = ?"
+_SQL_UPDATE_TITLE = "UPDATE book SET title = ? WHERE id = ?"
+_SQL_UPDATE_AUTHOR_NAME = "UPDATE author SET name = ? WHERE id = ?"
+_SQL_UPDATE_AUTHOR_COUNTRY = "UPDATE author SET country = ? WHERE id = ?"
+_SQL_DELETE_BOOK = "DELETE FROM book WHERE id = ?"
+_SQL_SEARCH_BY_ID = "SELECT id, title, authorID, qty FROM book WHERE id = ?"
+_SQL_SEARCH_BY_TITLE = (
+    "SELECT id, title, authorID, qty FROM book "
+    "WHERE id IN (SELECT rowid FROM book_fts WHERE book_fts MATCH ?)"
+)
+_SQL_VIEW_DETAILS = (
+    "SELECT b.title, a.name, a.country "
+    "FROM book b INNER JOIN author a ON b.authorID = a.id"
+)
+
+
+# ************************** VALIDATION FUNCTIONS **************************
+
+# Compile (and cache) the all-digits pattern for a given length
+@lru_cache(maxsize=None)
+def _digits_pattern(length):
+    return re.compile(rf"\d{{{length}}}" if length else r"\d+")
+
+
+# Function to validate the length of the Book Id
+def get_valid_integer(prompt, length=4):
+    """
+    Prompt user for a valid integer with optional length check
+    """
+    pattern = _digits_pattern(length)
+    while True:
+        # Prompt the user; one C-level regex match replaces the
+        # separate isdigit and length checks
+        value = input(prompt).strip()
+        if pattern.fullmatch(value):
+            return int(value)
+
+        if length:
+            print(f"Invalid input: Input must be {length} digits.")
+        else:
+            print("Invalid input: Input must be a number.")
+
+
+# ************************** CORE FUNCTIONALITY **************************
+
+# Function to add a book
+def enter_book(db):
+    """
+    Prompt user to enter details and insert them into book and author tables
+    """
+    cursor = db.cursor()  # create a cursor
+
+    # prompts user for book records
+    id = get_valid_integer("Enter book ID(4 digits): ")
+    title = input("Enter book title: ").strip()
+    authorID = get_valid_integer("Enter author ID(4 digits): ")
+    qty = int(input("Enter quantity: "))
+
+    # Checks if author already exists
+    cursor.execute(_SQL_FIND_AUTHOR, (authorID,))
+    if not cursor.fetchone():
+        print("Author not found. Please enter author details.")
+        name = input("Enter author's name: ").strip()
+        country = input("Enter author's country: ").strip()
+
+        # Insert all new records into author table
+        cursor.execute(_SQL_INSERT_AUTHOR, (authorID, name, country))
+
+    # Insert all new records into book table
+    cursor.execute(_SQL_INSERT_BOOK, (id, title, authorID, qty))
+    db.commit()
+    print("Book added to book database")
+
+
+# Function to update a book
+def update_book(db):
+    """
+    Update an existing book or author details
+    """
+    cursor = db.cursor()  # create a cursor
+
+    # Prompt user for a valid 4-digit book ID
+    id = get_valid_integer("Enter 4-digit book ID to update: ")
+
+    #  Fetch the book and author information using INNER JOIN
+    cursor.execute(_SQL_BOOK_WITH_AUTHOR, (id,))
+    record = cursor.fetchone()  # Get the first matching record
+
+    # If no record is found, notify the user and return
+    if not record:
+        print("Book not found.")
+        return
+    else:
+        # Display current book and author details
+        print("\nCurrent details:")
+        print(f"Title: {record[1]}")
+        print(f"Author: {record[2]}")
+        print(f"Country: {record[3]}")
+
+        # Display the available update options
+        print("\nUpdate options:")
+        print("1. Update quantity (default)")
+        print("2. Update title")
+        print("3. Update name")
+        print("4. Update author country")
+        choice = input("Select an option: ").strip()
+
+        # Based on user's choice, perform appropriate update;
+        # record[4] is the author's id fetched by the JOIN above
+        if choice == '1':
+            # Update quantity in book table
+            new_qty = get_valid_integer("Enter new quantity: ")
+            cursor.execute(_SQL_UPDATE_QTY, (new_qty, id))
+
+        elif choice == '2':
+            # Update title in book table
+            new_title = input("Enter new title: ").strip()
+            cursor.execute(_SQL_UPDATE_TITLE, (new_title, id))
+
+        elif choice == '3':
+            # Update author name in author table
+            new_name = input("Enter new name: ").strip()
+            cursor.execute(_SQL_UPDATE_AUTHOR_NAME, (new_name, record[4]))
+
+        elif choice == '4':
+            # Update author's country in author table
+            new_country = input("Enter new author country: ").strip()
+            cursor.execute(_SQL_UPDATE_AUTHOR_COUNTRY,
+                           (new_country, record[4]))
+
+        else:
+            # If invalid choice is given, print message and exit
+            print("Invalid choice.")
+            return
+
+        db.commit()
+        print("Book updated successfully!")
+
+
+# =============== Function to delete a book ===============
+def delete_book(db):
+    """
+    Delete a book from the database by the ID.
+    """
+    cursor = db.cursor()  # create a cursor
+
+    # Prompt the user to enter a 4-digit book ID
+    id = get_valid_integer("Enter 4-digit book ID to deete: ")
+
+    # Delete the book with the given ID
+    cursor.execute(_SQL_DELETE_BOOK, (id,))
+
+    # Check if any rows were deleted
+    if cursor.rowcount == 0:
+        print("No book found with that ID.")
+    else:
+        # If deletion was successful commit the change
+        db.commit()
+        print("Book deleted successfully.")
+
+
+# =============== Function to search for a book ===============
+def search_book(db):
+    """
+    Search for a specific book by title or ID.
+    """
+    cursor = db.cursor()  # create a cursor
+
+    # Prompt user to choose search method
+    print("\nSearch options:")
+    print("1. Search by ID")
+    print("2. Search by title")
+    choice = input("Select an option: ").strip()
+
+    # If the user wants to search by book ID
+    if choice == '1':
+        id = get_valid_integer("Enter book ID: ")  # Validate book ID
+        cursor.execute(_SQL_SEARCH_BY_ID, (id,))
+
+    # If the user wants to search by title
+    elif choice == '2':
+        title = input("Enter book title: ").strip()
+        # Look the title up in the full-text index; quote the input so
+        # punctuation is not treated as FTS query syntax
+        cursor.execute(_SQL_SEARCH_BY_TITLE,
+                       ('"' + title.replace('"', '""') + '"',))
+
+    # Handle invalid choices
+    else:
+        print("Invalid choice.")
+        return
+
+    # Fetch all matching results from the query
+    book_search = cursor.fetchall()
+    # If any books were found, print their details
+    if book_search:
+        print("\nFound books:")
+        for book in book_search:
+            print(f"ID: {book[0]}, Title: {book[1]}, "
+                  f"AuthorID: {book[2]}, Quantity: {book[3]}")
+    else:
+        print("No matching books found.")
+
+
+# =============== Function to view all book details ===============
+def view_book_details(db):
+    """
+    Display a list of books with the author's name and country
+    """
+    cursor = db.cursor()  # create a cursor
+    # Transfer rows from SQLite to Python in larger batches
+    cursor.arraysize = 128
+
+    # Join 'book' and 'author' tables
+    cursor.execute(_SQL_VIEW_DETAILS)
+    # Fetch matching records from the executed query
+    rows = cursor.fetchall()
+
+    # Check if any results were found
+    if rows:
+        # Build the whole listing in one string and write it out in a
+        # single call instead of several prints per book
+        divider = "-" * 50
+        sys.stdout.write("\nDetails\n" + "\n".join(
+            f"{divider}\n"
+            f"Title: {title}\n"
+            f"Author's Name: {name}\n"
+            f"Author's Country: {country}\n"
+            f"{divider}"
+            for title, name, country in rows
+        ) + "\n")
+    else:
+        # This message was unreachable before: the else was attached
+        # to the for loop instead of the if above
+        print("No books to display.")
+
+
+# =================== Main Program ===================
+
+# Initialize the database once and set up tables; this single connection
+# is reused by every menu handler below.
+db = get_database_connection()
+create_tables(db)
+populate_tables(db)
+
+# Menu text and dispatch table, built once instead of per iteration
+_MENU = """
+Menu:
+1. Enter book
+2. Update book
+3. Delete book
+4. Search books
+5. View details of all books
+0. Exit
+Enter your choice: """
+
+_MENU_ACTIONS = {
+    '1': enter_book,
+    '2': update_book,
+    '3': delete_book,
+    '4': search_book,
+    '5': view_book_details,
+}
+
+# Main user options
+while True:
+    choice = input(_MENU).strip()
+
+    if choice == '0':
+        print("Goodbye!")
+        break
+
+    # Dispatch with one dict lookup instead of a chain of comparisons
+    action = _MENU_ACTIONS.get(choice)
+    if action:
+        action(db)
+    else:
+        print("Invalid choice. Please try again.")
@@ -1,415 +1,652 @@
-"""
-Task Manager Application
-------------------------
-
-This program provides a simple task management system with user login,
-task assignment, and reporting functionality.
-
-Features:
-- User authentication (loaded from user.txt).
-- Admin-only user registration.
-- Add new tasks with validation.
-- View all tasks or only those assigned to the logged-in user.
-- Edit or mark personal tasks as complete.
-- Generate detailed reports (task_overview.txt and user_overview.txt).
-- Display statistics (admin only).
-
-Data Files:
-- user.txt : Stores usernames and passwords in 'username, password' format.
-- tasks.txt : Stores tasks in 'username, title, description, due_date,
-  assigned_date, completed' format.
-
-Admin User:
-- A default 'admin, admin' account is created automatically
-  if user.txt does not exist.
-
-Author: Paballo
-"""
-
-
-# ===== Importing external modules ============
-from datetime import datetime
-import os
-
-
-# ---- Helper Functions ----
-
-def reg_user():
-    """
-    Register a new user (admin only).
-
-    Prompts the admin to enter a new username and password.
-    Validates duplicate usernames and ensures password confirmation matches.
-    Saves the new user to user.txt.
-    """
-    if username != "admin":
-        print("Only admin can register new users.")
-        return
-
-    new_user = input("Enter new username: ")
-    if new_user in username_password:
-        print("Username already exists.")
-        return
-
-    new_password = input("Enter new password: ")
-    confirm_password = input("Confirm password: ")
-    if new_password == confirm_password:
-        username_password[new_user] = new_password
-        with open("user.txt", "a") as user_file:
-            user_file.write(f"\n{new_user}, {new_password}")
-        print("New user registered successfully.")
-    else:
-        print("Passwords do not match.")
-
-
-def add_task():
-    """
-    Allow a user to add a new task.
-
-    Prompts for:
-    - Assigned user (must exist).
-    - Task title and description.
-    - Due date in YYYY-MM-DD format.
-    Automatically assigns today's date as assigned_date
-    and defaults 'completed' to 'No'.
-    Appends the new task to tasks.txt.
-    """
-    assigned_user = input(
-        "Enter username of the person the task is assigned to: "
-    )
-    if assigned_user not in username_password:
-        print("User does not exist.")
-        return
-
-    task_title = input("Enter task title: ")
-    task_description = input("Enter task description: ")
-    due_date = input("Enter due date (YYYY-MM-DD): ")
-    assigned_date = datetime.today().strftime("%Y-%m-%d")
-
-    task_entry = (
-        f"{assigned_user}, {task_title}, {task_description}, "
-        f"{due_date}, {assigned_date}, No\n"
-    )
-
-    with open("tasks.txt", "a") as task_file:
-        task_file.write(task_entry)
-    print("Task added successfully.")
-
-
-def view_all():
-    """Display all tasks in the system."""
-    try:
-        with open("tasks.txt", "r") as task_file:
-            tasks = []
-            for line in task_file:
-                if line.strip():
-                    tasks.append(line.strip().split(", "))
-
-    except FileNotFoundError:
-        print("No tasks found.")
-        return
-
-    if not tasks:
-        print("No tasks to display.")
-        return
-
-    for i, task in enumerate(tasks, 1):
-        print(
-            f"""
-            Task {i}
-            User: {task[0]}
-            Title: {task[1]}
-            Description: {task[2]}
-            Due date: {task[3]}
-            Assigned date: {task[4]}
-            Completed: {task[5]}
-            """
-        )
-
-
-def view_mine():
-    """
-    Display tasks assigned to the current user.
-
-    Allows user to:
-    - Mark a task as complete.
-    - Edit the assigned user or due date (if not yet completed).
-    Validates usernames and due date format.
-    Updates the correct task entry in tasks.txt.
-    """
-    try:
-        with open("tasks.txt", "r") as task_file:
-            tasks = []
-            for line in task_file:
-                if line.strip():
-                    tasks.append(line.strip().split(", "))
-
-    except FileNotFoundError:
-        print("No tasks file found. Please add a task first.")
-        return
-
-    # Get tasks belonging to this user
-    user_task_indices = [i for i, t in enumerate(tasks) if t[0] == username]
-
-    if not user_task_indices:
-        print("No tasks assigned to you.")
-        return
-
-    # Display tasks
-    for idx, task_index in enumerate(user_task_indices, start=1):
-        task = tasks[task_index]
-        print(
-            f"""
-            Task {idx}
-            Title: {task[1]}
-            Description: {task[2]}
-            Due date: {task[3]}
-            Assigned date: {task[4]}
-            Completed: {task[5]}
-            """
-        )
-
-    try:
-        choice = int(
-            input(
-                    "Enter task number to edit/mark complete (-1 to return): "
-                )
-            )
-    except ValueError:
-        print("Invalid input.")
-        return
-
-    if choice == -1:
-        return
-
-    if choice < 1 or choice > len(user_task_indices):
-        print("Invalid task number.")
-        return
-
-    # Map back to original index in tasks list
-    real_index = user_task_indices[choice - 1]
-    selected_task = tasks[real_index]
-
-    # Action selection
-    action = input("Mark as complete (c) or edit (e): ").lower()
-    if action == "c":
-        selected_task[5] = "Yes"
-    elif action == "e":
-        if selected_task[5] == "Yes":
-            print("Task cannot be edited (already complete).")
-            return
-
-        # Validate new username
-        new_user = input("Enter new username: ")
-        if new_user not in username_password:
-            print("Invalid username. Task not reassigned.")
-            return
-
-        # Validate new due date
-        new_due = input("Enter new due date (YYYY-MM-DD): ")
-        try:
-            datetime.strptime(new_due, "%Y-%m-%d")
-        except ValueError:
-            print("Invalid date format. Task not updated.")
-            return
-
-        # Apply changes
-        selected_task[0] = new_user
-        selected_task[3] = new_due
-    else:
-        print("Invalid action.")
-        return
-
-    # Save back to file
-    with open("tasks.txt", "w") as task_file:
-        task_file.writelines([", ".join(t) + "\n" for t in tasks])
-
-    print("Task updated successfully.")
-
-
-def generate_reports():
-    """
-    Generate reports summarizing tasks and users.
-
-    Creates:
-    - task_overview.txt: Overall stats on tasks (totals, percentages).
-    - user_overview.txt: Per-user stats(counts/percentages of task status).
-    """
-    try:
-        with open("tasks.txt", "r") as task_file:
-            tasks = []
-            for line in task_file:
-                if line.strip():
-                    tasks.append(line.strip().split(", "))
-
-    except FileNotFoundError:
-        print("No tasks file found. Cannot generate reports.")
-        return
-
-    total_tasks = len(tasks)
-    completed = sum(1 for t in tasks if t[5] == "Yes")
-    incomplete = total_tasks - completed
-    overdue = sum(
-        1 for t in tasks
-        if (
-            t[5] == "No"
-            and datetime.strptime(t[3], "%Y-%m-%d") < datetime.today()
-        )
-    )
-
-    # ---- Task Overview ----
-    with open("task_overview.txt", "w") as f:
-        f.write("=== Task Overview ===\n")
-        f.write(f"Total tasks: {total_tasks}\n")
-        f.write(f"Completed: {completed}\n")
-        f.write(f"Incomplete: {incomplete}\n")
-        f.write(f"Overdue: {overdue}\n")
-
-        if total_tasks > 0:
-            f.write(f"% Incomplete: {incomplete / total_tasks * 100:.2f}%\n")
-            f.write(f"% Overdue: {overdue / total_tasks * 100:.2f}%\n")
-
-    # ---- User Overview ----
-    with open("user_overview.txt", "w") as f:
-        f.write("=== User Overview ===\n")
-        f.write(f"Total users: {len(username_password)}\n")
-        f.write(f"Total tasks: {total_tasks}\n")
-
-        for user in username_password:
-            user_tasks = [t for t in tasks if t[0] == user]
-            total_user = len(user_tasks)
-            completed_user = sum(1 for t in user_tasks if t[5] == "Yes")
-            incomplete_user = total_user - completed_user
-            overdue_user = sum(
-                1 for t in user_tasks
-                if (
-                    t[5] == "No"
-                    and datetime.strptime(t[3], "%Y-%m-%d") < datetime.today()
-                )
-            )
-
-            f.write(f"\n--- {user} ---\n")
-            f.write(f"Total tasks: {total_user}\n")
-
-            if total_tasks > 0:
-                f.write(
-                    f"% of all tasks: {total_user / total_tasks * 100:.2f}%\n"
-                )
-
-            if total_user > 0:
-                f.write(f"Completed: {completed_user}\n")
-                f.write(f"Incomplete: {incomplete_user}\n")
-                f.write(f"Overdue: {overdue_user}\n")
-                f.write(
-                    f"% Completed: {completed_user / total_user * 100:.2f}%\n"
-                )
-                f.write(
-                    f"% Incomplete: {incomplete_user/total_user * 100:.2f}%\n"
-                )
-                f.write(f"% Overdue: {overdue_user / total_user * 100:.2f}%\n")
-
-
-def display_statistics():
-    """
-    Display system statistics (admin only).
-
-    Automatically generates reports and prints
-    the contents of task_overview.txt and user_overview.txt to the console.
-    """
-    if username != "admin":
-        print("Only admin can view statistics.")
-        return
-
-    generate_reports()
-
-    with open("task_overview.txt", "r") as f:
-        print(f.read())
-    with open("user_overview.txt", "r") as f:
-        print(f.read())
-
-
-# ---- Main Program ----
-
-# Ensure required file exist
-if not os.path.exists("user.txt"):
-    with open("user.txt", "w") as f:
-        # Create default admin account if file doesn't exist
-        f.write("admin, admin\n")
-
-# Ensure required file exist
-if not os.path.exists("tasks.txt"):
-    # Create an empty file to avoid FileNotFoundError
-    open("tasks.txt", "w").close()
-
-# Load users
-username_password = {}
-with open("user.txt", "r") as user_file:
-    for line in user_file:
-        if line.strip():
-            try:
-                user, pw = line.strip().split(", ")
-                username_password[user] = pw
-            except ValueError:
-                # Skip malformed lines instead of crashing
-                continue
-
-
-# Login
-while True:
-    username = input("Username: ")
-    password = input("Password: ")
-    if (
-        username in username_password
-        and username_password[username] == password
-    ):
-
-        print("Login successful.")
-        break
-    else:
-        print("Invalid credentials.")
-
-# Menu loop
-while True:
-    if username == "admin":
-        menu = input(
-            """
-            Select one of the following options:
-            r  - Register a user
-            a  - Add a task
-            va - View all tasks
-            vm - View my tasks
-            gr - Generate reports
-            ds - Display statistics
-            e  - Exit
-            :
-            """
-        ).lower()
-    else:
-        menu = input(
-            """
-            Select one of the following options:
-            a  - Add a task
-            va - View all tasks
-            vm - View my tasks
-            e  - Exit
-            :
-            """
-        ).lower()
-
-    if menu == "r" and username == "admin":
-        reg_user()
-    elif menu == "a":
-        add_task()
-    elif menu == "va":
-        view_all()
-    elif menu == "vm":
-        view_mine()
-    elif menu == "gr" and username == "admin":
-        generate_reports()
-    elif menu == "ds" and username == "admin":
-        display_statistics()
-    elif menu == "e":
-        print("Goodbye!")
-        break
-    else:
-        print("Invalid choice. Try again.")
+"""
+Task Manager Application
+------------------------
+
+This program provides a simple task management system with user login,
+task assignment, and reporting functionality.
+
+Features:
+- User authentication (loaded from the users table).
+- Admin-only user registration.
+- Add new tasks with validation.
+- View all tasks or only those assigned to the logged-in user.
+- Edit or mark personal tasks as complete.
+- Generate detailed reports (task_overview.txt and user_overview.txt).
+- Display statistics (admin only).
+
+Data Files:
+- task_manager.db : SQLite database storing users and tasks in the
+  'users' and 'tasks' tables. Records from legacy user.txt and
+  tasks.txt files are imported automatically on the first run.
+
+Admin User:
+- A default 'admin, admin' account is created automatically
+  if no users exist yet.
+
+Author: Paballo
+"""
+
+
+# ===== Importing external modules ============
+from datetime import datetime
+import atexit
+import hashlib
+import hmac
+import os
+import sqlite3
+import sys
+
+
+# ---- Database Setup ----
+
+def get_database_connection(db_name="task_manager.db"):
+    """
+    Create database connection and return to the SQLite database.
+
+    The connection is opened once and shared by every function so the
+    SQLite page cache stays warm between operations.
+    """
+    db = sqlite3.connect(db_name)
+    # WAL journaling with relaxed syncing cuts the fsync cost of every
+    # commit while keeping the database safe against crashes
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    # Make sure the connection is closed cleanly when the program exits
+    atexit.register(db.close)
+    return db
+
+
+def create_tables(db):
+    """
+    Create the users and tasks tables if they do not exist.
+    """
+    cursor = db.cursor()
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            username TEXT PRIMARY KEY,
+            password TEXT NOT NULL
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            due_date TEXT NOT NULL,
+            assigned_date TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+    # Index usernames so per-user lookups do not scan the whole table
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_tasks_user ON tasks(username)
+    ''')
+    db.commit()
+
+
+def migrate_tasks_file(db):
+    """
+    Import tasks from a legacy tasks.txt flat file, once.
+
+    Only runs when the tasks table is still empty, so existing
+    installations keep their tasks after upgrading to the database.
+    """
+    cursor = db.cursor()
+    cursor.execute("SELECT 1 FROM tasks LIMIT 1")
+    if cursor.fetchone() or not os.path.exists("tasks.txt"):
+        return
+
+    rows = []
+    with open("tasks.txt", "r") as task_file:
+        for line in task_file:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            fields = line.split(", ", 5)
+            if len(fields) != 6:
+                # Skip malformed lines instead of crashing
+                continue
+            rows.append(fields[:5] + [1 if fields[5] == "Yes" else 0])
+
+    cursor.executemany('''
+        INSERT INTO tasks (username, title, description, due_date,
+                           assigned_date, completed)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', rows)
+    db.commit()
+
+
+def migrate_users_file(db):
+    """
+    Import users from a legacy user.txt flat file, once.
+
+    Only runs when the users table is still empty; creates the default
+    admin account when there is no legacy file to import.
+    """
+    cursor = db.cursor()
+    cursor.execute("SELECT 1 FROM users LIMIT 1")
+    if cursor.fetchone():
+        return
+
+    rows = []
+    if os.path.exists("user.txt"):
+        with open("user.txt", "r") as user_file:
+            for line in user_file:
+                if line.strip():
+                    try:
+                        user, pw = line.strip().split(", ")
+                        rows.append((user, pw))
+                    except ValueError:
+                        # Skip malformed lines instead of crashing
+                        continue
+    if not rows:
+        # Create default admin account if no users were found
+        rows = [("admin", "admin")]
+
+    cursor.executemany(
+        "INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)",
+        rows
+    )
+    db.commit()
+
+
+# ---- Password Handling ----
+
+# Scrypt work factors; OpenSSL's C implementation keeps a login under
+# 50ms at these settings while staying brute-force resistant
+_SCRYPT_N = 16384
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+# Hex lengths of the two halves of a stored 'salt$digest' value:
+# a 16-byte salt and the 64-byte scrypt digest
+_SALT_HEX_LEN = 32
+_DIGEST_HEX_LEN = 128
+
+
+def _is_hashed(stored):
+    """
+    Return True if a stored value is a well-formed 'salt$digest' hash.
+
+    Both halves must be hex of the exact expected lengths, so a legacy
+    plaintext password that happens to contain a '$' is not mistaken
+    for an already-hashed value.
+    """
+    salt_hex, sep, digest_hex = stored.partition("$")
+    if not sep:
+        return False
+    if len(salt_hex) != _SALT_HEX_LEN or len(digest_hex) != _DIGEST_HEX_LEN:
+        return False
+    try:
+        bytes.fromhex(salt_hex)
+        bytes.fromhex(digest_hex)
+    except ValueError:
+        return False
+    return True
+
+
+def hash_password(password, salt=None):
+    """
+    Hash a password with scrypt and return it as 'salt$digest' in hex.
+    """
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.scrypt(
+        password.encode(), salt=salt,
+        n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P
+    )
+    return salt.hex() + "$" + digest.hex()
+
+
+def verify_password(stored, candidate):
+    """
+    Check a candidate password against a stored 'salt$digest' value.
+
+    Uses hmac.compare_digest so the comparison takes the same time
+    whether or not the hashes match.
+    """
+    try:
+        salt_hex, _ = stored.split("$", 1)
+        salt = bytes.fromhex(salt_hex)
+    except ValueError:
+        # A malformed stored value can never match
+        return False
+    recomputed = hash_password(candidate, salt)
+    return hmac.compare_digest(stored, recomputed)
+
+
+def upgrade_plaintext_passwords(db):
+    """
+    Hash any passwords still stored as plaintext, once.
+
+    Anything that is not a well-formed 'salt$digest' value is treated
+    as a legacy plaintext password and hashed.
+    """
+    cursor = db.cursor()
+    cursor.execute("SELECT username, password FROM users")
+    legacy = [
+        (user, pw) for user, pw in cursor.fetchall() if not _is_hashed(pw)
+    ]
+    if not legacy:
+        return
+
+    cursor.executemany(
+        "UPDATE users SET password = ? WHERE username = ?",
+        [(hash_password(pw), user) for user, pw in legacy]
+    )
+    db.commit()
+
+
+# ---- Helper Functions ----
+
+def reg_user():
+    """
+    Register a new user (admin only).
+
+    Prompts the admin to enter a new username and password.
+    Validates duplicate usernames and ensures password confirmation matches.
+    Saves the new user to the users table.
+    """
+    if username != "admin":
+        print("Only admin can register new users.")
+        return
+
+    new_user = input("Enter new username: ")
+    if new_user in username_password:
+        print("Username already exists.")
+        return
+
+    new_password = input("Enter new password: ")
+    confirm_password = input("Confirm password: ")
+    if new_password == confirm_password:
+        # Only the salted hash is kept, never the plaintext password
+        hashed = hash_password(new_password)
+        username_password[new_user] = hashed
+        with db:
+            db.execute(
+                "INSERT OR IGNORE INTO users (username, password) "
+                "VALUES (?, ?)",
+                (new_user, hashed)
+            )
+        print("New user registered successfully.")
+    else:
+        print("Passwords do not match.")
+
+
+def add_task():
+    """
+    Allow a user to add a new task.
+
+    Prompts for:
+    - Assigned user (must exist).
+    - Task title and description.
+    - Due date in YYYY-MM-DD format.
+    Automatically assigns today's date as assigned_date
+    and defaults 'completed' to 0 (not complete).
+    Inserts the new task into the tasks table.
+    """
+    assigned_user = input(
+        "Enter username of the person the task is assigned to: "
+    )
+    if assigned_user not in username_password:
+        print("User does not exist.")
+        return
+
+    task_title = input("Enter task title: ")
+    task_description = input("Enter task description: ")
+    due_date = input("Enter due date (YYYY-MM-DD): ")
+    assigned_date = datetime.today().strftime("%Y-%m-%d")
+
+    cursor = db.cursor()
+    cursor.execute('''
+        INSERT INTO tasks (username, title, description, due_date,
+                           assigned_date, completed)
+        VALUES (?, ?, ?, ?, ?, 0)
+    ''', (assigned_user, task_title, task_description, due_date,
+          assigned_date))
+    db.commit()
+    print("Task added successfully.")
+
+
+# Maximum rows handed to executemany at a time during bulk imports
+_INSERT_CHUNK_SIZE = 200
+
+
+def add_tasks_bulk(entries):
+    """
+    Insert many tasks at once, in a single transaction.
+
+    Intended for scripted imports. Each entry is a tuple of
+    (username, title, description, due_date, assigned_date, completed).
+    Rows go through executemany in chunks inside one transaction, so an
+    import of N tasks pays one commit instead of N.
+    """
+    with db:
+        for start in range(0, len(entries), _INSERT_CHUNK_SIZE):
+            db.executemany('''
+                INSERT INTO tasks (username, title, description, due_date,
+                                   assigned_date, completed)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', entries[start:start + _INSERT_CHUNK_SIZE])
+
+
+def view_all():
+    """Display all tasks in the system."""
+    cursor = db.cursor()
+    cursor.execute('''
+        SELECT username, title, description, due_date, assigned_date,
+               completed
+        FROM tasks
+    ''')
+
+    # Stream rows straight off the cursor instead of buffering the
+    # whole table in a list; each task goes out as a single write, so
+    # the first tasks appear while later rows are still being fetched
+    count = 0
+    for task in cursor:
+        count += 1
+        sys.stdout.write(
+            f"\n"
+            f"            Task {count}\n"
+            f"            User: {task[0]}\n"
+            f"            Title: {task[1]}\n"
+            f"            Description: {task[2]}\n"
+            f"            Due date: {task[3]}\n"
+            f"            Assigned date: {task[4]}\n"
+            f"            Completed: {'Yes' if task[5] else 'No'}\n"
+        )
+
+    if count == 0:
+        print("No tasks to display.")
+
+
+def view_mine():
+    """
+    Display tasks assigned to the current user.
+
+    Allows user to:
+    - Mark a task as complete.
+    - Edit the assigned user or due date (if not yet completed).
+    Validates usernames and due date format.
+    Updates the selected task row in the tasks table.
+    """
+    cursor = db.cursor()
+    cursor.execute('''
+        SELECT id, title, description, due_date, assigned_date, completed
+        FROM tasks
+        WHERE username = ?
+    ''', (username,))
+    my_tasks = cursor.fetchall()
+
+    if not my_tasks:
+        print("No tasks assigned to you.")
+        return
+
+    # Display tasks
+    for idx, task in enumerate(my_tasks, start=1):
+        print(
+            f"""
+            Task {idx}
+            Title: {task[1]}
+            Description: {task[2]}
+            Due date: {task[3]}
+            Assigned date: {task[4]}
+            Completed: {"Yes" if task[5] else "No"}
+            """
+        )
+
+    try:
+        choice = int(
+            input(
+                    "Enter task number to edit/mark complete (-1 to return): "
+                )
+            )
+    except ValueError:
+        print("Invalid input.")
+        return
+
+    if choice == -1:
+        return
+
+    if choice < 1 or choice > len(my_tasks):
+        print("Invalid task number.")
+        return
+
+    selected_task = my_tasks[choice - 1]
+    task_id = selected_task[0]
+
+    # Action selection; 'with db:' wraps each update in a single
+    # BEGIN/COMMIT transaction
+    action = input("Mark as complete (c) or edit (e): ").lower()
+    if action == "c":
+        # Update just the one affected row
+        with db:
+            db.execute(
+                "UPDATE tasks SET completed = 1 WHERE id = ?", (task_id,)
+            )
+    elif action == "e":
+        if selected_task[5]:
+            print("Task cannot be edited (already complete).")
+            return
+
+        # Validate new username
+        new_user = input("Enter new username: ")
+        if new_user not in username_password:
+            print("Invalid username. Task not reassigned.")
+            return
+
+        # Validate new due date
+        new_due = input("Enter new due date (YYYY-MM-DD): ")
+        try:
+            datetime.strptime(new_due, "%Y-%m-%d")
+        except ValueError:
+            print("Invalid date format. Task not updated.")
+            return
+
+        # Apply changes
+        with db:
+            db.execute(
+                "UPDATE tasks SET username = ?, due_date = ? WHERE id = ?",
+                (new_user, new_due, task_id)
+            )
+    else:
+        print("Invalid action.")
+        return
+
+    print("Task updated successfully.")
+
+
+def generate_reports():
+    """
+    Generate reports summarizing tasks and users.
+
+    Creates:
+    - task_overview.txt: Overall stats on tasks (totals, percentages).
+    - user_overview.txt: Per-user stats(counts/percentages of task status).
+    """
+    cursor = db.cursor()
+
+    # Compute today's date once and let SQLite do all the counting;
+    # ISO-8601 dates compare correctly as strings
+    today = datetime.today().strftime("%Y-%m-%d")
+
+    # Overall counters come from the tasks table alone, so tasks whose
+    # username is not (or no longer) a registered user still count
+    cursor.execute('''
+        SELECT COUNT(*),
+               COALESCE(SUM(completed), 0),
+               COALESCE(SUM(completed = 0 AND due_date < ?), 0)
+        FROM tasks
+    ''', (today,))
+    total_tasks, completed, overdue = cursor.fetchone()
+    incomplete = total_tasks - completed
+
+    cursor.execute('''
+        SELECT u.username,
+               COUNT(t.id),
+               COALESCE(SUM(t.completed), 0),
+               COALESCE(SUM(t.completed = 0 AND t.due_date < ?), 0)
+        FROM users u
+        LEFT JOIN tasks t ON t.username = u.username
+        GROUP BY u.username
+    ''', (today,))
+    # Per-user counters are (total, completed, overdue)
+    user_stats = {row[0]: row[1:] for row in cursor.fetchall()}
+
+    # ---- Task Overview ----
+    with open("task_overview.txt", "w") as f:
+        f.write("=== Task Overview ===\n")
+        f.write(f"Total tasks: {total_tasks}\n")
+        f.write(f"Completed: {completed}\n")
+        f.write(f"Incomplete: {incomplete}\n")
+        f.write(f"Overdue: {overdue}\n")
+
+        if total_tasks > 0:
+            f.write(f"% Incomplete: {incomplete / total_tasks * 100:.2f}%\n")
+            f.write(f"% Overdue: {overdue / total_tasks * 100:.2f}%\n")
+
+    # ---- User Overview ----
+    with open("user_overview.txt", "w") as f:
+        f.write("=== User Overview ===\n")
+        f.write(f"Total users: {len(username_password)}\n")
+        f.write(f"Total tasks: {total_tasks}\n")
+
+        for user in username_password:
+            # Counters come from the GROUP BY above; users without
+            # tasks simply get zeros
+            total_user, completed_user, overdue_user = user_stats.get(
+                user, (0, 0, 0)
+            )
+            incomplete_user = total_user - completed_user
+
+            f.write(f"\n--- {user} ---\n")
+            f.write(f"Total tasks: {total_user}\n")
+
+            if total_tasks > 0:
+                f.write(
+                    f"% of all tasks: {total_user / total_tasks * 100:.2f}%\n"
+                )
+
+            if total_user > 0:
+                f.write(f"Completed: {completed_user}\n")
+                f.write(f"Incomplete: {incomplete_user}\n")
+                f.write(f"Overdue: {overdue_user}\n")
+                f.write(
+                    f"% Completed: {completed_user / total_user * 100:.2f}%\n"
+                )
+                f.write(
+                    f"% Incomplete: {incomplete_user/total_user * 100:.2f}%\n"
+                )
+                f.write(f"% Overdue: {overdue_user / total_user * 100:.2f}%\n")
+
+
+def display_statistics():
+    """
+    Display system statistics (admin only).
+
+    Automatically generates reports and prints
+    the contents of task_overview.txt and user_overview.txt to the console.
+    """
+    if username != "admin":
+        print("Only admin can view statistics.")
+        return
+
+    generate_reports()
+
+    with open("task_overview.txt", "r") as f:
+        print(f.read())
+    with open("user_overview.txt", "r") as f:
+        print(f.read())
+
+
+# ---- Main Program ----
+
+# Open the database once and import any legacy flat-file contents
+db = get_database_connection()
+create_tables(db)
+migrate_tasks_file(db)
+migrate_users_file(db)
+upgrade_plaintext_passwords(db)
+
+# Load users straight from the users table, no text parsing involved
+username_password = dict(
+    db.execute("SELECT username, password FROM users")
+)
+
+
+# Login
+while True:
+    username = input("Username: ")
+    password = input("Password: ")
+    if (
+        username in username_password
+        and verify_password(username_password[username], password)
+    ):
+
+        print("Login successful.")
+        break
+    else:
+        print("Invalid credentials.")
+
+# Menu text and dispatch tables, built once instead of per iteration;
+# admin-only options only exist in the admin table
+_ADMIN_MENU = """
+            Select one of the following options:
+            r  - Register a user
+            a  - Add a task
+            va - View all tasks
+            vm - View my tasks
+            gr - Generate reports
+            ds - Display statistics
+            e  - Exit
+            :
+            """
+
+_USER_MENU = """
+            Select one of the following options:
+            a  - Add a task
+            va - View all tasks
+            vm - View my tasks
+            e  - Exit
+            :
+            """
+
+_ADMIN_ACTIONS = {
+    "r": reg_user,
+    "a": add_task,
+    "va": view_all,
+    "vm": view_mine,
+    "gr": generate_reports,
+    "ds": display_statistics,
+}
+
+_USER_ACTIONS = {
+    "a": add_task,
+    "va": view_all,
+    "vm": view_mine,
+}
+
+if username == "admin":
+    menu_text, menu_actions = _ADMIN_MENU, _ADMIN_ACTIONS
+else:
+    menu_text, menu_actions = _USER_MENU, _USER_ACTIONS
+
+# Menu loop
+while True:
+    # Case-fold the input once, then dispatch with one dict lookup
+    # instead of a chain of string comparisons
+    menu = input(menu_text).strip().casefold()
+
+    if menu == "e":
+        print("Goodbye!")
+        break
+
+    action = menu_actions.get(menu)
+    if action:
+        action()
+    else:
+        print("Invalid choice. Try again.")